@@ -62,6 +62,46 @@ double f(double x, Coeffs coeffs) {
     return result;
 }
 
+const char *results_path(const char *default_path)
+{
+    // RESULTS_FILE lets sweeps keep their rows apart from the main benchmark
+    const char *path = getenv("RESULTS_FILE");
+    return (path && *path) ? path : default_path;
+}
+
+int only_size(void)
+{
+    // POINT_SIZE restricts a run to one list from sizes.txt (used by the perf driver)
+    const char *size = getenv("POINT_SIZE");
+    return size ? atoi(size) : 0;
+}
+
+void configure_schedule(void)
+{
+    // Loop uses schedule(runtime); keep the old dynamic,1 unless OMP_SCHEDULE says otherwise
+    if (!getenv("OMP_SCHEDULE"))
+    {
+        omp_set_schedule(omp_sched_dynamic, 1);
+    }
+}
+
+const char *schedule_name(omp_sched_t kind)
+{
+    switch (kind & ~omp_sched_monotonic)
+    {
+    case omp_sched_static:
+        return "static";
+    case omp_sched_dynamic:
+        return "dynamic";
+    case omp_sched_guided:
+        return "guided";
+    case omp_sched_auto:
+        return "auto";
+    default:
+        return "unknown";
+    }
+}
+
 void process_file(const char *filename, Coeffs coeffs, int num_threads)
 {
     int rank, size;
@@ -148,6 +188,10 @@ void process_file(const char *filename, Coeffs coeffs, int num_threads)
 
     // Set number of OpenMP threads
     omp_set_num_threads(num_threads);
+
+    omp_sched_t schedule_kind;
+    int chunk_size;
+    omp_get_schedule(&schedule_kind, &chunk_size);
     
     // Start timing - ONLY measuring computation time
     double start_time = MPI_Wtime();
@@ -157,7 +201,7 @@ void process_file(const char *filename, Coeffs coeffs, int num_threads)
     
     #pragma omp parallel reduction(+:local_matches)
     {
-        #pragma omp for schedule(dynamic)
+        #pragma omp for schedule(runtime)
         for (int i = 0; i < local_count; i++)
         {
             double expected = f(local_xs[i], coeffs);
@@ -183,11 +227,11 @@ void process_file(const char *filename, Coeffs coeffs, int num_threads)
     // Root process handles output
     if (rank == 0)
     {
-        printf("Processes: %d | Threads/Process: %d | File: %s | Matches: %d / %d | Computation Time: %lf sec\n",
-               size, num_threads, filename, total_matches, total_count, max_time);
+        printf("Processes: %d | Threads/Process: %d | Schedule: %s,%d | File: %s | Matches: %d / %d | Computation Time: %lf sec\n",
+               size, num_threads, schedule_name(schedule_kind), chunk_size, filename, total_matches, total_count, max_time);
 
-        FILE *result = fopen("out/results.hybrid.csv", "a");
-        fprintf(result, "%d,%d,%d,%lf\n", size, num_threads, total_count, max_time);
+        FILE *result = fopen(results_path("out/results.hybrid.csv"), "a");
+        fprintf(result, "%d,%d,%d,%lf,%s,%d\n", size, num_threads, total_count, max_time, schedule_name(schedule_kind), chunk_size);
         fclose(result);
 
         // Free root's arrays
@@ -236,6 +280,8 @@ int main(int argc, char *argv[])
         printf("No thread count specified. Using max available threads (%d).\n", num_threads);
     }
 
+    configure_schedule();
+
     Coeffs coeffs;
 
     // Root process reads coefficients
@@ -268,8 +314,12 @@ int main(int argc, char *argv[])
         }
 
         int file_size;
+        int selected_size = only_size();
         while (fscanf(sizes_file, "%d", &file_size) == 1)
         {
+            if (selected_size > 0 && file_size != selected_size)
+                continue;
+
             // Broadcast the file size (non-negative value means continue)
             MPI_Bcast(&file_size, 1, MPI_INT, 0, MPI_COMM_WORLD);
 
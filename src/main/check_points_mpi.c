@@ -61,6 +61,20 @@ double f(double x, Coeffs coeffs) {
     return result;
 }
 
+const char *results_path(const char *default_path)
+{
+    // RESULTS_FILE lets sweeps keep their rows apart from the main benchmark
+    const char *path = getenv("RESULTS_FILE");
+    return (path && *path) ? path : default_path;
+}
+
+int only_size(void)
+{
+    // POINT_SIZE restricts a run to one list from sizes.txt (used by the perf driver)
+    const char *size = getenv("POINT_SIZE");
+    return size ? atoi(size) : 0;
+}
+
 void process_file(const char *filename, Coeffs coeffs)
 {
     int rank, size;
@@ -179,7 +193,7 @@ void process_file(const char *filename, Coeffs coeffs)
         printf("Processes: %d | File: %s | Matches: %d / %d | Computation Time: %lf sec\n",
                size, filename, total_matches, total_count, max_time);
 
-        FILE *result = fopen("out/results.mpi.csv", "a");
+        FILE *result = fopen(results_path("out/results.mpi.csv"), "a");
         fprintf(result, "%d,%d,%lf\n", size, total_count, max_time);
         fclose(result);
 
@@ -236,8 +250,12 @@ int main(int argc, char *argv[])
         }
 
         int file_size;
+        int selected_size = only_size();
         while (fscanf(sizes_file, "%d", &file_size) == 1)
         {
+            if (selected_size > 0 && file_size != selected_size)
+                continue;
+
             // Broadcast the file size (non-negative value means continue)
             MPI_Bcast(&file_size, 1, MPI_INT, 0, MPI_COMM_WORLD);
 
@@ -62,6 +62,46 @@ double f(double x, Coeffs coeffs) {
     return result;
 }
 
+const char *results_path(const char *default_path)
+{
+    // RESULTS_FILE lets sweeps keep their rows apart from the main benchmark
+    const char *path = getenv("RESULTS_FILE");
+    return (path && *path) ? path : default_path;
+}
+
+int only_size(void)
+{
+    // POINT_SIZE restricts a run to one list from sizes.txt (used by the perf driver)
+    const char *size = getenv("POINT_SIZE");
+    return size ? atoi(size) : 0;
+}
+
+void configure_schedule(void)
+{
+    // Loop uses schedule(runtime); keep the old dynamic,1 unless OMP_SCHEDULE says otherwise
+    if (!getenv("OMP_SCHEDULE"))
+    {
+        omp_set_schedule(omp_sched_dynamic, 1);
+    }
+}
+
+const char *schedule_name(omp_sched_t kind)
+{
+    switch (kind & ~omp_sched_monotonic)
+    {
+    case omp_sched_static:
+        return "static";
+    case omp_sched_dynamic:
+        return "dynamic";
+    case omp_sched_guided:
+        return "guided";
+    case omp_sched_auto:
+        return "auto";
+    default:
+        return "unknown";
+    }
+}
+
 int count_valid_points(const char *filename, Coeffs coeffs, int threads, int size)
 {
     FILE *file = fopen(filename, "r");
@@ -74,6 +114,10 @@ int count_valid_points(const char *filename, Coeffs coeffs, int threads, int siz
     int count = 0;
 
     omp_set_num_threads(threads);
+
+    omp_sched_t schedule_kind;
+    int chunk_size;
+    omp_get_schedule(&schedule_kind, &chunk_size);
     
     double start = omp_get_wtime();
 
@@ -89,7 +133,7 @@ int count_valid_points(const char *filename, Coeffs coeffs, int threads, int siz
 
     int match_count = 0;
 
-    #pragma omp parallel for reduction(+ : match_count) schedule(dynamic)
+    #pragma omp parallel for reduction(+ : match_count) schedule(runtime)
     for (int i = 0; i < count; i++){
         double expected = f(xs[i], coeffs);
         if (fabs(expected - ys[i]) < TOLERANCE)
@@ -104,10 +148,10 @@ int count_valid_points(const char *filename, Coeffs coeffs, int threads, int siz
     double end = omp_get_wtime();
     double time_spent = end - start;
 
-    printf("Threads: %d | File: %s | Matches: %d / %d | Time: %lf sec\n", threads, filename, match_count, count, time_spent);
+    printf("Threads: %d | Schedule: %s,%d | File: %s | Matches: %d / %d | Time: %lf sec\n", threads, schedule_name(schedule_kind), chunk_size, filename, match_count, count, time_spent);
 
-    FILE *result = fopen("out/results.opm.csv", "a");
-    fprintf(result, "%d,%d,%lf\n", threads, count, time_spent);
+    FILE *result = fopen(results_path("out/results.opm.csv"), "a");
+    fprintf(result, "%d,%d,%lf,%s,%d\n", threads, count, time_spent, schedule_name(schedule_kind), chunk_size);
     fclose(result);
 
     return match_count;
@@ -132,6 +176,8 @@ int main(int argc, char *argv[])
         printf("No thread count specified. Using 1 thread.\n");
     }
 
+    configure_schedule();
+
     FILE *coeff_file = fopen("point_lists/coeffs.json", "r");
     if (!coeff_file)
     {
@@ -154,8 +200,13 @@ int main(int argc, char *argv[])
 
     // Max size of points list
 
+    int selected_size = only_size();
+
     while (fscanf(sizes_file, "%d", &size) == 1)
     {
+        if (selected_size > 0 && size != selected_size)
+            continue;
+
         char filename[100];
         sprintf(filename, "point_lists/points_%d.txt", size);
 
@@ -0,0 +1,181 @@
+"""Python/NumPy checker, the reference backend next to the C checkers.
+
+Each points file is loaded once into shared memory; a process pool evaluates
+f() on slices of it, every worker reading through a zero-copy NumPy view.
+Results are appended as workers,size,time like the OpenMP and MPI checkers.
+
+Usage (from src/): python3 main/check_points_python.py [workers]
+"""
+import json
+import math
+import os
+import sys
+import time
+from multiprocessing import Pool, resource_tracker, shared_memory
+
+# NumPy's SIMD pow/exp/log/tan/... kernels differ from libm in the last bit, and
+# at |f(x)| ~ 1e36 one ulp is far above TOLERANCE. Turning off the dispatched
+# x86 kernels makes NumPy call libm like the C checkers and generate_points.py
+# (names for NumPy 1.x and 2.x; set the variable yourself to override).
+os.environ.setdefault("NPY_DISABLE_CPU_FEATURES",
+                      "AVX2 FMA3 AVX512F AVX512CD AVX512_SKX AVX512_CLX AVX512_CNL AVX512_ICL AVX512_SPR X86_V3 X86_V4")
+
+import numpy as np
+
+TOLERANCE = 1e-3
+
+# Several slices per worker so a slow worker does not hold up the rest
+TASKS_PER_WORKER = 4
+
+# Shared memory block attached by this worker: (block, view)
+_attached = {}
+
+
+def f(x, coeffs):
+    """Vectorized f(), same terms in the same order as in the C checkers."""
+    result = np.zeros_like(x)
+    abs_x = np.abs(x)
+
+    result += coeffs["a"] * np.power(x, 12) + np.sin(np.power(x, 5))
+    result += coeffs["b"] * np.power(x, 10) + np.cos(np.power(x, 3))
+    result += coeffs["c"] * np.power(x, 8) + np.tan(np.power(x, 2))
+    result += coeffs["d"] * np.power(x, 6)
+    result += coeffs["e"] * np.power(x, 4)
+    result += coeffs["f"]
+
+    for i in range(5):
+        inner = np.power(abs_x + i, 1.0 + (i % 3) / 5.0)
+        result += (
+            np.sin(np.power(inner, 3)) * np.cos(np.power(inner, 2)) * np.tan(inner) +
+            np.log1p(inner) +
+            np.sqrt(inner + 1.0) +
+            np.exp(inner / 1000.0) +
+            np.sinh(inner / 1000.0) +
+            np.tanh(inner / 1000.0)
+        )
+
+    # Both branches are evaluated, sqrt(x + 1) is NaN where the other one is taken
+    with np.errstate(invalid="ignore"):
+        result += np.where(x > 0, np.arctan(np.sqrt(x + 1)), np.arccos(np.tanh(abs_x)))
+
+    for i in range(1, 10):
+        result += np.power(abs_x + i, 1.0 / (2.0 * i + 1.0))
+
+    noise = np.zeros_like(x)
+    for i in range(1000):
+        noise += np.sin(i * x * 0.0001) * np.cos(i * x * 0.0002)
+
+    result += noise / 100.0
+
+    return result
+
+
+def attach(name, count):
+    """Zero-copy view of the points in shared memory, attached once per worker and file."""
+    if name not in _attached:
+        # The previous file's block can only be closed once no view refers to it
+        while _attached:
+            _, (block, view) = _attached.popitem()
+            del view
+            block.close()
+
+        block = shared_memory.SharedMemory(name=name)
+        _attached[name] = (block, np.ndarray((count, 2), dtype=np.float64, buffer=block.buf))
+    return _attached[name][1]
+
+
+def count_matches(task):
+    name, count, start, stop, coeffs = task
+    points = attach(name, count)[start:stop]
+    expected = f(points[:, 0], coeffs)
+    return int(np.count_nonzero(np.abs(expected - points[:, 1]) < TOLERANCE))
+
+
+def results_path(default_path):
+    # RESULTS_FILE lets sweeps keep their rows apart from the main benchmark
+    return os.environ.get("RESULTS_FILE") or default_path
+
+
+def only_size():
+    # POINT_SIZE restricts a run to one list from sizes.txt (used by the perf driver)
+    size = os.environ.get("POINT_SIZE")
+    return int(size) if size else 0
+
+
+def count_valid_points(pool, filename, coeffs, workers):
+    start = time.perf_counter()
+
+    try:
+        points = np.loadtxt(filename, delimiter=",", dtype=np.float64, ndmin=2)
+    except OSError as e:
+        print(f"Cannot open file: {e}")
+        return -1
+
+    count = len(points)
+    block = shared_memory.SharedMemory(create=True, size=max(points.nbytes, 1))
+    try:
+        shared = np.ndarray(points.shape, dtype=np.float64, buffer=block.buf)
+        shared[:] = points
+        del points, shared
+
+        step = max(1, math.ceil(count / (workers * TASKS_PER_WORKER)))
+        tasks = [(block.name, count, first, min(first + step, count), coeffs) for first in range(0, count, step)]
+        match_count = sum(pool.imap_unordered(count_matches, tasks))
+    finally:
+        block.close()
+        block.unlink()
+
+    end = time.perf_counter()
+    time_spent = end - start
+
+    print(f"Workers: {workers} | File: {filename} | Matches: {match_count} / {count} | Time: {time_spent:f} sec")
+
+    with open(results_path("out/results.python.csv"), "a") as result:
+        result.write(f"{workers},{count},{time_spent:f}\n")
+
+    return match_count
+
+
+def main():
+    # Check if worker count was provided
+    workers = 1
+
+    if len(sys.argv) > 1:
+        try:
+            workers = int(sys.argv[1])
+        except ValueError:
+            workers = 0
+        if workers < 1:
+            print(f"Invalid worker count: {sys.argv[1]}. Using 1 worker.")
+            workers = 1
+    else:
+        print("No worker count specified. Using 1 worker.")
+
+    try:
+        with open("point_lists/coeffs.json") as coeff_file:
+            coeffs = json.load(coeff_file)
+        with open("point_lists/sizes.txt") as sizes_file:
+            sizes = [int(line) for line in sizes_file if line.strip()]
+    except FileNotFoundError as e:
+        print(f"Error: Could not find file {e.filename}")
+        return 1
+
+    selected_size = only_size()
+
+    # Workers share this resource tracker, so the blocks they attach are not
+    # reported as leaked (or unlinked a second time) when they exit
+    resource_tracker.ensure_running()
+
+    # The pool outlives the files, like the OpenMP thread team
+    with Pool(workers) as pool:
+        for size in sizes:
+            if selected_size > 0 and size != selected_size:
+                continue
+
+            count_valid_points(pool, f"point_lists/points_{size}.txt", coeffs, workers)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
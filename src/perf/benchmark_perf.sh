@@ -0,0 +1,127 @@
+#!/usr/bin/env bash
+# Runs the checkers under Linux `perf stat` and stores hardware counters next to
+# each result row. Every (units, size) pair is a separate run (POINT_SIZE), and
+# MPI ranks are wrapped individually so counters are kept per rank. Threads of
+# a rank are aggregated by perf itself.
+#
+# Usage (from src/): perf/benchmark_perf.sh [omp] [mpi] [hybrid]
+#
+# Output rows:
+#   out/perf.opm.csv, out/perf.mpi.csv  units,size,time,rank,cycles,instructions,cache_misses,branch_misses
+#   out/perf.hybrid.csv                 procs,threads,size,time,rank,cycles,instructions,cache_misses,branch_misses
+set -e
+
+EVENTS="cycles,instructions,cache-misses,branch-misses"
+
+BIN_DIR=${BIN_DIR:-out}
+OUT_DIR=${OUT_DIR:-out}
+MPIRUN=${MPIRUN:-mpirun}
+UNITS=${UNITS:-"1 2 4 8 16"}
+HYBRID_PROCS=${HYBRID_PROCS:-"1 2 4"}
+HYBRID_THREADS=${HYBRID_THREADS:-"1 2 4"}
+
+if ! command -v perf > /dev/null; then
+    echo "perf not found, install linux-tools for your kernel"
+    exit 1
+fi
+
+if [[ ! -f "point_lists/sizes.txt" ]]; then
+    echo "Missing point_lists/sizes.txt, run points/generate_points.py first"
+    exit 1
+fi
+
+BACKENDS=${*:-"omp mpi hybrid"}
+TMP_DIR=$(mktemp -d)
+trap 'rm -rf "$TMP_DIR"' EXIT
+
+mkdir -p "$OUT_DIR"
+
+# Prints "cycles,instructions,cache_misses,branch_misses" from a `perf stat -x,` file.
+# Unsupported or uncounted events are left empty.
+counter_row() {
+    awk -F, -v events="$EVENTS" '
+        /^#/ || NF < 3 { next }
+        {
+            name = $3
+            sub(/^cpu_[a-z]+\//, "", name)   # hybrid CPUs report cpu_core/cycles/ and cpu_atom/cycles/
+            sub(/[\/:].*$/, "", name)
+            if ($1 ~ /^[0-9.]+$/) value[name] += $1
+        }
+        END {
+            n = split(events, e, ",")
+            row = ""
+            # %.0f keeps full integers; mawk would print counts above 2^31 as %.6g
+            for (i = 1; i <= n; i++) row = row (i > 1 ? "," : "") (e[i] in value ? sprintf("%.0f", value[e[i]]) : "")
+            print row
+        }
+    ' "$1"
+}
+
+# run_counted <perf csv> <key> <size> <time column> <command...>
+# <key> is the leading units (or procs,threads) part of the row.
+run_counted() {
+    local perf_csv=$1 key=$2 size=$3 time_column=$4
+    shift 4
+
+    rm -f "$TMP_DIR"/perf.* "$TMP_DIR/results.csv"
+    POINT_SIZE=$size RESULTS_FILE="$TMP_DIR/results.csv" "$@"
+
+    local result time
+    result=$(tail -n 1 "$TMP_DIR/results.csv")
+    time=$(echo "$result" | cut -d, -f"$time_column")
+
+    for counters in "$TMP_DIR"/perf.*; do
+        echo "$key,$size,$time,${counters##*.},$(counter_row "$counters")" >> "$perf_csv"
+    done
+}
+
+# Each rank writes its own counters; the rank id comes from the MPI launcher
+PERF_RANK='exec perf stat -x, -e '"$EVENTS"' -o "$0.${OMPI_COMM_WORLD_RANK:-${PMI_RANK:-0}}" -- "$@"'
+
+SIZES=$(cat point_lists/sizes.txt)
+
+for backend in $BACKENDS; do
+    case $backend in
+        omp)
+            rm -f "$OUT_DIR/perf.opm.csv"
+            echo "Running OpenMP benchmark under perf..."
+            for t in $UNITS; do
+                for s in $SIZES; do
+                    echo "  Running with $t threads, size $s..."
+                    run_counted "$OUT_DIR/perf.opm.csv" "$t" "$s" 3 \
+                        perf stat -x, -e "$EVENTS" -o "$TMP_DIR/perf.0" -- "$BIN_DIR/check_points_openmp" "$t"
+                done
+            done
+            ;;
+        mpi)
+            rm -f "$OUT_DIR/perf.mpi.csv"
+            echo "Running MPI benchmark under perf..."
+            for p in $UNITS; do
+                for s in $SIZES; do
+                    echo "  Running with $p processes, size $s..."
+                    run_counted "$OUT_DIR/perf.mpi.csv" "$p" "$s" 3 \
+                        $MPIRUN -np "$p" sh -c "$PERF_RANK" "$TMP_DIR/perf" "$BIN_DIR/check_points_mpi"
+                done
+            done
+            ;;
+        hybrid)
+            rm -f "$OUT_DIR/perf.hybrid.csv"
+            echo "Running Hybrid MPI+OpenMP benchmark under perf..."
+            for p in $HYBRID_PROCS; do
+                for t in $HYBRID_THREADS; do
+                    for s in $SIZES; do
+                        echo "  Running with $p processes, $t threads per process, size $s..."
+                        run_counted "$OUT_DIR/perf.hybrid.csv" "$p,$t" "$s" 4 \
+                            $MPIRUN -np "$p" sh -c "$PERF_RANK" "$TMP_DIR/perf" "$BIN_DIR/check_points_hybrid" "$t"
+                    done
+                done
+            done
+            ;;
+        *)
+            echo "Unknown backend: $backend (expected omp, mpi or hybrid)"
+            exit 1
+            ;;
+    esac
+done
+
+echo "Performance counters written to $OUT_DIR/perf.*.csv"
@@ -0,0 +1,296 @@
+import pandas as pd
+import matplotlib.pyplot as plt
+import argparse
+import json
+import math
+import os
+import sys
+import numpy as np
+
+from results_io import load_campaigns, read_results, size_label
+
+BACKEND_NAMES = {"openmp": "OpenMP", "mpi": "MPI", "hybrid": "Hybrid", "python": "Python"}
+
+# Exit codes: regression found / invocation or data error
+EXIT_REGRESSION = 1
+EXIT_ERROR = 2
+
+# With fewer runs per side the significance tests are skipped and only the threshold applies
+# (4 vs 4 is the smallest exact test that can reach p < 0.05)
+MIN_SAMPLES = 4
+
+def exact_u_counts(m, n):
+    """Number of orderings giving each U = 0..m*n for samples of size m and n without ties."""
+    # table[i][j] holds the counts for i candidate and j baseline values
+    table = [[None] * (n + 1) for _ in range(m + 1)]
+    for i in range(m + 1):
+        for j in range(n + 1):
+            if i == 0 or j == 0:
+                table[i][j] = [1]
+                continue
+            counts = [0] * (i * j + 1)
+            # The largest value is either a candidate (beating all j baseline values) or a baseline value
+            for u, count in enumerate(table[i - 1][j]):
+                counts[u + j] += count
+            for u, count in enumerate(table[i][j - 1]):
+                counts[u] += count
+            table[i][j] = counts
+    return table[m][n]
+
+def mann_whitney_greater(candidate, baseline):
+    """One-sided Mann-Whitney U test that candidate times tend to be larger.
+
+    Uses the exact distribution for small samples without ties and the
+    normal approximation with tie correction otherwise. Returns the p-value.
+    """
+    m, n = len(candidate), len(baseline)
+    values = sorted(list(candidate) + list(baseline))
+
+    # Average ranks over ties
+    ranks = {}
+    tie_term = 0
+    i = 0
+    while i < len(values):
+        j = i
+        while j + 1 < len(values) and values[j + 1] == values[i]:
+            j += 1
+        ranks[values[i]] = (i + j) / 2 + 1
+        tie_term += (j - i + 1) ** 3 - (j - i + 1)
+        i = j + 1
+
+    u = sum(ranks[value] for value in candidate) - m * (m + 1) / 2
+
+    if tie_term == 0 and m <= 20 and n <= 20:
+        counts = exact_u_counts(m, n)
+        return sum(counts[int(round(u)):]) / sum(counts)
+
+    variance = m * n / 12 * ((m + n + 1) - tie_term / ((m + n) * (m + n - 1)))
+    if variance <= 0:
+        return 1.0
+    z = (u - m * n / 2 - 0.5) / math.sqrt(variance)
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+def compare_backend(base_df, cand_df, backend, threshold, alpha):
+    """Compare the time distributions of every (units, size) group of one backend."""
+    is_hybrid = backend == "hybrid"
+    keys = ["procs", "threads", "units", "size"] if is_hybrid else ["units", "size"]
+
+    def single_unit_medians(df):
+        if is_hybrid:
+            base_rows = df[(df["procs"] == 1) & (df["threads"] == 1)]
+        else:
+            base_rows = df[df["units"] == 1]
+        return base_rows.groupby("size")["time"].median()
+
+    base_t1 = single_unit_medians(base_df)
+    cand_t1 = single_unit_medians(cand_df)
+
+    base_groups = {key: group["time"].tolist() for key, group in base_df.groupby(keys)}
+    cand_groups = {key: group["time"].tolist() for key, group in cand_df.groupby(keys)}
+
+    groups = []
+    for key in sorted(set(base_groups) & set(cand_groups)):
+        row = dict(zip(keys, (int(value) for value in key)))
+        base_times, cand_times = base_groups[key], cand_groups[key]
+        base_median = float(np.median(base_times))
+        cand_median = float(np.median(cand_times))
+        time_change = cand_median / base_median - 1
+
+        testable = min(len(base_times), len(cand_times)) >= MIN_SAMPLES
+        p_value = mann_whitney_greater(cand_times, base_times) if testable else None
+
+        # Efficiency E(p) = T(1) / (p * T(p)), one sample per run against its own campaign's T(1) median
+        size, units = row["size"], row["units"]
+        base_efficiency = cand_efficiency = efficiency_change = efficiency_p_value = None
+        if size in base_t1.index and size in cand_t1.index:
+            base_efficiencies = [base_t1[size] / (units * time) for time in base_times]
+            cand_efficiencies = [cand_t1[size] / (units * time) for time in cand_times]
+            base_efficiency = float(np.median(base_efficiencies))
+            cand_efficiency = float(np.median(cand_efficiencies))
+            efficiency_change = cand_efficiency / base_efficiency - 1
+            if testable:
+                efficiency_p_value = mann_whitney_greater(base_efficiencies, cand_efficiencies)
+
+        reasons = []
+        if time_change > threshold and (p_value is None or p_value < alpha):
+            reasons.append("time")
+        if (efficiency_change is not None and efficiency_change < -threshold
+                and (efficiency_p_value is None or efficiency_p_value < alpha)):
+            reasons.append("efficiency")
+
+        # A group that got faster is never a regression, whatever its T(1) did
+        if time_change <= 0:
+            reasons = []
+
+        if reasons:
+            status = "regression"
+        elif time_change < -threshold:
+            status = "improvement"
+        else:
+            status = "unchanged"
+
+        row.update({
+            "backend": backend,
+            "config": f"{row['procs']}p×{row['threads']}t" if is_hybrid else str(units),
+            "baseline_runs": len(base_times),
+            "candidate_runs": len(cand_times),
+            "baseline_median": base_median,
+            "candidate_median": cand_median,
+            "time_change": time_change,
+            "p_value": p_value,
+            "baseline_efficiency": base_efficiency,
+            "candidate_efficiency": cand_efficiency,
+            "efficiency_change": None if efficiency_change is None else float(efficiency_change),
+            "efficiency_p_value": efficiency_p_value,
+            "status": status,
+            "reasons": reasons
+        })
+        groups.append(row)
+    return groups
+
+def main():
+    # Set up command-line argument parsing
+    parser = argparse.ArgumentParser(description="Detect performance regressions between a baseline and a candidate result set",
+                                     epilog=f"Exits with {EXIT_REGRESSION} when a regression is found and {EXIT_ERROR} on errors")
+    parser.add_argument("baseline", help="Baseline campaign name (with --db) or results CSV file")
+    parser.add_argument("candidate", help="Candidate campaign name (with --db) or results CSV file")
+    parser.add_argument("--db", help="Compare campaigns of this SQLite results database (see results_db.py)")
+    parser.add_argument("--suite", help="With --db: suite of the campaigns", default="benchmark")
+    parser.add_argument("--backend", nargs="+", choices=list(BACKEND_NAMES),
+                        help="Backends to compare (default: all with --db, from the file name otherwise)")
+    parser.add_argument("--threshold", type=float, default=0.05,
+                        help="Relative slowdown or efficiency loss that counts as a regression (default: 0.05)")
+    parser.add_argument("--alpha", type=float, default=0.05,
+                        help="Significance level of the Mann-Whitney U tests on time and efficiency (default: 0.05)")
+    parser.add_argument("--output", help="Path of the JSON verdict (default: regression.json next to the results)")
+    parser.add_argument("--prefix", help="Prefix for output filenames", default="")
+
+    # Parse arguments
+    args = parser.parse_args()
+
+    print(f"Baseline: {args.baseline}")
+    print(f"Candidate: {args.candidate}")
+    print(f"Threshold: {args.threshold:.1%}, alpha: {args.alpha}")
+
+    try:
+        if args.db:
+            backends = args.backend or list(BACKEND_NAMES)
+            output_dir = os.path.dirname(args.db) or "."
+        else:
+            from results_db import backend_from_path
+
+            backend = args.backend[0] if args.backend else backend_from_path(args.candidate)
+            if backend is None:
+                print("Error: Cannot tell the backend from the file name, pass --backend")
+                return EXIT_ERROR
+            backends = [backend]
+            output_dir = os.path.dirname(args.candidate) or "."
+
+        groups = []
+        for backend in backends:
+            if args.db:
+                try:
+                    base_df = load_campaigns(args.db, backend, [args.baseline], args.suite)
+                    cand_df = load_campaigns(args.db, backend, [args.candidate], args.suite)
+                except ValueError as e:
+                    print(f"Skipping {BACKEND_NAMES[backend]}: {e}")
+                    continue
+            else:
+                base_df = read_results(args.baseline, hybrid=backend == "hybrid")
+                cand_df = read_results(args.candidate, hybrid=backend == "hybrid")
+
+            if base_df.empty or cand_df.empty:
+                print(f"Skipping {BACKEND_NAMES[backend]}: no results in one of the campaigns")
+                continue
+
+            groups.extend(compare_backend(base_df, cand_df, backend, args.threshold, args.alpha))
+
+        if not groups:
+            print("No configurations present in both result sets.")
+            return EXIT_ERROR
+
+        regressions = [group for group in groups if group["status"] == "regression"]
+        verdict = {
+            "baseline": args.baseline,
+            "candidate": args.candidate,
+            "threshold": args.threshold,
+            "alpha": args.alpha,
+            "verdict": "fail" if regressions else "pass",
+            "regressions": len(regressions),
+            "untested": sum(1 for group in groups if group["p_value"] is None),
+            "groups": groups
+        }
+
+        output_file = args.output or f"{output_dir}/{args.prefix}regression.json"
+        with open(output_file, "w") as verdict_file:
+            json.dump(verdict, verdict_file, indent=2)
+
+        results_df = pd.DataFrame(groups)
+        min_size = results_df["size"].min()
+
+        # --- TIME CHANGE CHART, ONE PANEL PER BACKEND ---
+        backends = [backend for backend in BACKEND_NAMES if backend in results_df["backend"].values]
+        fig, axes = plt.subplots(1, len(backends), figsize=(7 * len(backends), 6), sharey=True, squeeze=False)
+
+        for ax, backend in zip(axes[0], backends):
+            backend_df = results_df[results_df["backend"] == backend]
+            configs = list(backend_df.sort_values("units")["config"].unique())
+            positions = {config: i for i, config in enumerate(configs)}
+
+            for size in sorted(backend_df["size"].unique()):
+                subset = backend_df[backend_df["size"] == size].copy()
+                subset["position"] = subset["config"].map(positions)
+                subset = subset.sort_values("position")
+                ax.plot(subset["position"], subset["time_change"] * 100, marker='o', label=size_label(size, min_size))
+
+                flagged = subset[subset["status"] == "regression"]
+                ax.scatter(flagged["position"], flagged["time_change"] * 100, marker='x', s=120, color='red', zorder=3,
+                           label="regression" if size == backend_df["size"].min() else "_nolegend_")
+
+            ax.axhline(y=0, color='gray', alpha=0.7)
+            ax.axhspan(-args.threshold * 100, args.threshold * 100, color='lightgray', alpha=0.3)
+            ax.set_xticks(range(len(configs)))
+            ax.set_xticklabels(configs)
+            ax.set_xlabel("Parallel units")
+            ax.set_title(BACKEND_NAMES[backend])
+            ax.grid(True, alpha=0.3)
+
+        axes[0][0].set_ylabel("Time change vs baseline [%]")
+        axes[0][-1].legend(title="Problem size", loc='upper left', bbox_to_anchor=(1, 1))
+        fig.suptitle(f"{args.candidate} vs {args.baseline}")
+
+        chart_file = f"{output_dir}/{args.prefix}regression_diff.png"
+        fig.tight_layout()
+        fig.savefig(chart_file)
+
+        print(f"\n=== REGRESSION CHECK: {verdict['verdict'].upper()} ===")
+        print(f"{'Backend':<8} {'Units':<8} {'Size':<6} {'Base (s)':<10} {'Cand (s)':<10} {'Change':<8} {'p':<7} {'Eff. chg':<9} {'p(eff)':<7} {'Status':<12}")
+        print("-" * 92)
+        for group in groups:
+            p_value = "-" if group["p_value"] is None else f"{group['p_value']:.3f}"
+            efficiency = "-" if group["efficiency_change"] is None else f"{group['efficiency_change']:+.1%}"
+            efficiency_p = "-" if group["efficiency_p_value"] is None else f"{group['efficiency_p_value']:.3f}"
+            print(f"{BACKEND_NAMES[group['backend']]:<8} {group['config']:<8} {size_label(group['size'], min_size):<6} "
+                  f"{group['baseline_median']:<10.6f} {group['candidate_median']:<10.6f} {group['time_change']:<+8.1%} "
+                  f"{p_value:<7} {efficiency:<9} {efficiency_p:<7} {group['status']:<12}")
+
+        if verdict["untested"]:
+            print(f"\nWarning: {verdict['untested']} configurations have fewer than {MIN_SAMPLES} runs per side; "
+                  f"they were judged by the threshold alone (use REPEATS={MIN_SAMPLES} or more)")
+
+        print(f"\nVerdict saved to {output_file}")
+        print(f"Plot saved to {chart_file}")
+
+        return EXIT_REGRESSION if regressions else 0
+
+    except FileNotFoundError as e:
+        print(f"Error: Could not find file {e.filename}")
+        return EXIT_ERROR
+    except Exception as e:
+        print(f"Error: {e}")
+        import traceback
+        traceback.print_exc()
+        return EXIT_ERROR
+
+if __name__ == "__main__":
+    sys.exit(main())
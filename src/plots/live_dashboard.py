@@ -0,0 +1,301 @@
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+import argparse
+import datetime
+import html
+import os
+import sys
+import time
+
+from results_db import backend_from_path, connect, list_campaigns, parse_row, query_results
+from results_io import size_label
+
+BACKEND_NAMES = {"openmp": "OpenMP", "mpi": "MPI", "hybrid": "Hybrid", "python": "Python"}
+
+DEFAULT_FILES = ["out/results.opm.csv", "out/results.mpi.csv", "out/results.hybrid.csv",
+                 "out/results.python.csv"]
+
+class CsvTail:
+    """Reads the rows appended to a results CSV since the previous poll."""
+
+    def __init__(self, path, backend):
+        self.path = path
+        self.backend = backend
+        self.key = path
+        self.name = os.path.basename(path)[:-len(".csv")] if path.endswith(".csv") else os.path.basename(path)
+        self.inode = None
+        self.offset = 0
+
+    def poll(self):
+        """Returns (restarted, rows); restarted is set when the file was removed or truncated."""
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            restarted = self.offset > 0
+            self.inode, self.offset = None, 0
+            return restarted, []
+
+        restarted = False
+        if stat.st_ino != self.inode or stat.st_size < self.offset:
+            # make benchmark removes the CSVs before starting over
+            restarted = self.inode is not None
+            self.inode, self.offset = stat.st_ino, 0
+
+        with open(self.path, "rb") as results_file:
+            results_file.seek(self.offset)
+            chunk = results_file.read()
+
+        # Keep a half-written last line for the next poll
+        complete = chunk[:chunk.rfind(b"\n") + 1]
+        self.offset += len(complete)
+
+        lines = complete.decode().splitlines()
+        rows = [parse_row(line.split(","), self.backend) for line in lines if line.strip()]
+        return restarted, [row for row in rows if row is not None]
+
+class DbTail:
+    """Reads the rows ingested into the results database since the previous poll.
+
+    Without a campaign it follows the latest campaign of its backend and
+    starts over when a newer one appears.
+    """
+
+    def __init__(self, db_path, backend, campaign, suite):
+        self.db_path = db_path
+        self.backend = backend
+        self.key = f"{db_path}:{backend}"
+        self.name = backend
+        self.campaign = campaign
+        self.follow_latest = campaign is None
+        self.suite = suite
+        self.last_row = 0
+
+    def poll(self):
+        """Returns (restarted, rows); restarted is set when a newer campaign replaced the followed one."""
+        restarted = False
+        conn = connect(self.db_path)
+        try:
+            if self.follow_latest:
+                campaigns = list_campaigns(conn, self.backend, self.suite)
+                latest = campaigns[0][0] if campaigns else None
+                if latest != self.campaign:
+                    restarted = self.campaign is not None
+                    self.campaign, self.last_row = latest, 0
+                    if latest is not None:
+                        print(f"{self.key}: following campaign {latest}")
+                if self.campaign is None:
+                    return False, []
+
+            rows = query_results(conn, backend=self.backend, campaign=self.campaign, suite=self.suite,
+                                 after_row=self.last_row)
+        finally:
+            conn.close()
+        if rows:
+            self.last_row = max(row["row_id"] for row in rows)
+        return restarted, rows
+
+class LiveResults:
+    """Running means per (size, configuration) and the speedup/efficiency derived from them.
+
+    Only groups that received new rows since the last refresh are recomputed,
+    plus the rest of their size when the single-unit baseline changed.
+    """
+
+    def __init__(self):
+        self.groups = {}     # source -> {(size, procs, threads, units): [runs, total time]}
+        self.metrics = {}    # source -> {size: {group key: metric row}}
+        self.dirty = {}      # (source, size) -> group keys to recompute
+        self.latest = []     # most recent rows for the HTML table
+        self.rows = 0
+
+    def restart(self, source):
+        self.rows -= sum(runs for runs, _ in self.groups.get(source, {}).values())
+        self.groups.pop(source, None)
+        self.metrics.pop(source, None)
+        self.dirty = {key: keys for key, keys in self.dirty.items() if key[0] != source}
+
+    def add(self, source, backend, row):
+        key = (row["size"], row["procs"], row["threads"], row["units"])
+        group = self.groups.setdefault(source, {}).setdefault(key, [0, 0.0])
+        group[0] += 1
+        group[1] += row["time"]
+        self.dirty.setdefault((source, row["size"]), set()).add(key)
+        self.rows += 1
+        self.latest = (self.latest + [(backend, row)])[-20:]
+
+    def refresh(self):
+        """Recompute the metrics of the dirty groups; returns True if anything changed."""
+        changed = bool(self.dirty)
+        for (source, size), keys in self.dirty.items():
+            groups = self.groups[source]
+            size_metrics = self.metrics.setdefault(source, {}).setdefault(size, {})
+
+            # Baseline: single unit (1 process × 1 thread for hybrid runs)
+            base_key = next((key for key in groups if key[0] == size and key[3] == 1), None)
+            base_time = groups[base_key][1] / groups[base_key][0] if base_key else None
+            if base_key in keys:
+                # A new baseline time changes every speedup of this size
+                keys = [key for key in groups if key[0] == size]
+
+            for key in keys:
+                _, procs, threads, units = key
+                runs, total = groups[key]
+                mean_time = total / runs
+                speedup = base_time / mean_time if base_time else None
+                size_metrics[key] = {
+                    "units": units,
+                    "procs": procs,
+                    "threads": threads,
+                    "runs": runs,
+                    "time": mean_time,
+                    "speedup": speedup,
+                    "efficiency": speedup / units if speedup else None
+                }
+        self.dirty.clear()
+        return changed
+
+def write_atomic(path, write):
+    temp_path = f"{path}.tmp"
+    write(temp_path)
+    os.replace(temp_path, path)
+
+def render_source(live, source, backend, image_file):
+    sizes = live.metrics.get(source, {})
+    if not sizes:
+        return False
+
+    min_size = min(sizes)
+    fig, (time_ax, speedup_ax, efficiency_ax) = plt.subplots(1, 3, figsize=(18, 5))
+
+    for size in sorted(sizes):
+        # Hybrid layouts with the same total units are averaged
+        by_units = {}
+        for metric in sizes[size].values():
+            by_units.setdefault(metric["units"], []).append(metric)
+        units = sorted(by_units)
+        label = size_label(size, min_size)
+
+        def mean_of(column):
+            values = [[m[column] for m in by_units[u] if m[column] is not None] for u in units]
+            return [sum(v) / len(v) if v else float("nan") for v in values]
+
+        time_ax.plot(units, mean_of("time"), marker='o', label=label)
+        speedup_ax.plot(units, mean_of("speedup"), marker='o', label=label)
+        efficiency_ax.plot(units, mean_of("efficiency"), marker='o', label=label)
+
+    max_units = max(metric["units"] for metrics in sizes.values() for metric in metrics.values())
+    speedup_ax.plot([0, max_units], [0, max_units], linestyle='--', color='lightgray', label="perfect")
+    efficiency_ax.plot([0, max_units], [1.0, 1.0], linestyle='--', color='lightgray', label="perfect")
+
+    time_ax.set_ylabel("Execution time [s]")
+    speedup_ax.set_ylabel("Speedup S(p) = T(1)/T(p)")
+    efficiency_ax.set_ylabel("Efficiency S(p)/p")
+    for ax in (time_ax, speedup_ax, efficiency_ax):
+        ax.set_xlabel("Parallel units")
+        ax.grid(True)
+    efficiency_ax.legend(title="Problem size", loc='upper left', bbox_to_anchor=(1, 1))
+    fig.suptitle(f"{BACKEND_NAMES.get(backend, backend)} ({source})")
+    fig.tight_layout()
+
+    write_atomic(image_file, lambda path: fig.savefig(path, format="png"))
+    plt.close(fig)
+    return True
+
+def write_page(live, images, page_file, interval):
+    stamp = int(time.time())
+    parts = [
+        "<!DOCTYPE html>",
+        "<html><head><meta charset=\"utf-8\">",
+        f"<meta http-equiv=\"refresh\" content=\"{interval}\">",
+        "<title>Benchmark live view</title></head><body>",
+        "<h1>Benchmark live view</h1>",
+        f"<p>Updated {datetime.datetime.now().isoformat(timespec='seconds')} &middot; {live.rows} rows</p>",
+    ]
+    for title, image in images:
+        parts.append(f"<h2>{html.escape(title)}</h2>")
+        parts.append(f"<img src=\"{html.escape(os.path.basename(image))}?{stamp}\" style=\"max-width: 100%\">")
+
+    parts.append("<h2>Latest rows</h2>")
+    parts.append("<table border=\"1\" cellpadding=\"4\"><tr><th>Backend</th><th>Config</th><th>Size</th><th>Time (s)</th></tr>")
+    for backend, row in reversed(live.latest):
+        config = f"{row['procs']}p×{row['threads']}t" if row["procs"] is not None else str(row["units"])
+        parts.append(f"<tr><td>{BACKEND_NAMES.get(backend, backend)}</td><td>{config}</td>"
+                     f"<td>{row['size']}</td><td>{row['time']:.6f}</td></tr>")
+    parts.append("</table></body></html>")
+
+    def write(path):
+        with open(path, "w") as page:
+            page.write("\n".join(parts))
+    write_atomic(page_file, write)
+
+def main():
+    # Set up command-line argument parsing
+    parser = argparse.ArgumentParser(description="Live speedup, efficiency and time charts that update while a benchmark runs")
+    parser.add_argument("results_files", nargs="*", help=f"Results CSV files to tail (default: {' '.join(DEFAULT_FILES)})")
+    parser.add_argument("--db", help="Tail this SQLite results database (see results_db.py) instead of CSV files")
+    parser.add_argument("--campaign", help="With --db: only rows of this campaign (default: latest campaign of each backend)")
+    parser.add_argument("--suite", help="With --db: only rows of this suite", default="benchmark")
+    parser.add_argument("--output-dir", help="Directory for the images and index.html", default="out/live")
+    parser.add_argument("--interval", type=float, default=10, help="Seconds between refreshes (default: 10)")
+    parser.add_argument("--once", action="store_true", help="Render the current state once and exit")
+
+    # Parse arguments
+    args = parser.parse_args()
+    output_dir = args.output_dir
+    os.makedirs(output_dir, exist_ok=True)
+
+    if args.db:
+        sources = [DbTail(args.db, backend, args.campaign, args.suite) for backend in BACKEND_NAMES]
+    else:
+        sources = []
+        for path in args.results_files or DEFAULT_FILES:
+            backend = backend_from_path(path)
+            if backend is None:
+                print(f"Error: Cannot tell the backend of '{path}' from its name")
+                return 1
+            sources.append(CsvTail(path, backend))
+
+    page_file = os.path.join(output_dir, "index.html")
+    print(f"Tailing {', '.join(source.key for source in sources)}")
+    print(f"Writing {page_file} every {args.interval:g}s (Ctrl+C to stop)")
+
+    live = LiveResults()
+    first = True
+
+    try:
+        while True:
+            for source in sources:
+                restarted, rows = source.poll()
+                if restarted:
+                    print(f"{source.key} started over, dropping its previous rows")
+                    live.restart(source.key)
+                for row in rows:
+                    live.add(source.key, source.backend, row)
+
+            if live.refresh() or first:
+                images = []
+                for source in sources:
+                    image_file = os.path.join(output_dir, f"live_{source.name}.png")
+                    if render_source(live, source.key, source.backend, image_file):
+                        images.append((BACKEND_NAMES[source.backend], image_file))
+                write_page(live, images, page_file, max(int(args.interval), 1))
+                print(f"[{datetime.datetime.now():%H:%M:%S}] {live.rows} rows, updated {page_file}")
+                first = False
+
+            if args.once:
+                break
+            time.sleep(args.interval)
+
+    except KeyboardInterrupt:
+        print("Stopped")
+    except Exception as e:
+        print(f"Error: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
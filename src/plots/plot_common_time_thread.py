@@ -2,11 +2,21 @@ import pandas as pd
 import matplotlib.pyplot as plt
 import numpy as np
 import os
+import argparse
+
+from results_io import load_campaigns, read_results
 
 def main():
+    parser = argparse.ArgumentParser(description="Compare MPI, OpenMP, Hybrid and Python results for the 16W workload")
+    parser.add_argument("--db", help="Read results from this SQLite database (see results_db.py) instead of ../out CSV files")
+    parser.add_argument("--campaign", nargs="+",
+                        help="With --db: campaigns to include (default: latest campaign of each backend)")
+    args = parser.parse_args()
+
     mpi_file = "../out/results.mpi.csv"
     omp_file = "../out/results.opm.csv"
     hybrid_file = "../out/results.hybrid.csv"
+    python_file = "../out/results.python.csv"
 
     target_size = 1600000
     min_size = 100000
@@ -14,22 +24,32 @@ def main():
     print(f"Analyzing results for workload size: {target_size} (16W)")
 
     try:
-        mpi_df = pd.read_csv(mpi_file, names=["units", "size", "time"])
-        mpi_16w = mpi_df[mpi_df["size"] == target_size].copy()
+        # Repeated runs of the same configuration are averaged
+        mpi_df = load_campaigns(args.db, "mpi", args.campaign) if args.db else read_results(mpi_file)
+        mpi_16w = mpi_df[mpi_df["size"] == target_size].groupby("units", as_index=False)["time"].mean()
         mpi_16w["type"] = "MPI"
 
-        omp_df = pd.read_csv(omp_file, names=["units", "size", "time"])
-        omp_16w = omp_df[omp_df["size"] == target_size].copy()
+        omp_df = load_campaigns(args.db, "openmp", args.campaign) if args.db else read_results(omp_file)
+        omp_16w = omp_df[omp_df["size"] == target_size].groupby("units", as_index=False)["time"].mean()
         omp_16w["type"] = "OpenMP"
 
-        hybrid_df = pd.read_csv(hybrid_file, names=["procs", "threads", "size", "time"])
-        hybrid_16w = hybrid_df[hybrid_df["size"] == target_size].copy()
-        hybrid_16w["units"] = hybrid_16w["procs"] * hybrid_16w["threads"]
+        hybrid_df = load_campaigns(args.db, "hybrid", args.campaign) if args.db else read_results(hybrid_file, hybrid=True)
+        hybrid_16w = hybrid_df[hybrid_df["size"] == target_size].groupby(["procs", "threads", "units"], as_index=False)["time"].mean()
         hybrid_16w["type"] = "Hybrid"
 
+        # The Python checker is the reference backend; older result sets lack it
+        try:
+            python_df = load_campaigns(args.db, "python", args.campaign) if args.db else read_results(python_file)
+            python_16w = python_df[python_df["size"] == target_size].groupby("units", as_index=False)["time"].mean()
+        except (FileNotFoundError, ValueError) as e:
+            print(f"Skipping Python: {e}")
+            python_16w = pd.DataFrame(columns=["units", "time"])
+        python_16w["type"] = "Python"
+
         print(f"MPI data points for 16W: {len(mpi_16w)}")
         print(f"OpenMP data points for 16W: {len(omp_16w)}")
         print(f"Hybrid data points for 16W: {len(hybrid_16w)}")
+        print(f"Python data points for 16W: {len(python_16w)}")
 
         plot_data = []
 
@@ -49,6 +69,14 @@ def main():
                 "config": "N/A"
             })
 
+        for _, row in python_16w.iterrows():
+            plot_data.append({
+                "units": row["units"],
+                "time": row["time"],
+                "type": "Python",
+                "config": "N/A"
+            })
+
         hybrid_best = {}
         for _, row in hybrid_16w.iterrows():
             units = row["units"]
@@ -75,10 +103,10 @@ def main():
 
         plt.figure(figsize=(12, 6))
 
-        colors = {'MPI': 'blue', 'OpenMP': 'red', 'Hybrid': 'green'}
-        markers = {'MPI': 'o', 'OpenMP': 's', 'Hybrid': 'o'}
+        colors = {'MPI': 'blue', 'OpenMP': 'red', 'Hybrid': 'green', 'Python': 'purple'}
+        markers = {'MPI': 'o', 'OpenMP': 's', 'Hybrid': 'o', 'Python': '^'}
 
-        for impl_type in ['MPI', 'OpenMP', 'Hybrid']:
+        for impl_type in ['MPI', 'OpenMP', 'Hybrid', 'Python']:
             data = results_df[results_df["type"] == impl_type]
             if not data.empty:
                 data_sorted = data.sort_values("units")
@@ -87,8 +115,10 @@ def main():
                          label=impl_type, linewidth=2, markersize=4)
 
         max_units = results_df["units"].max()
-        if 1 in results_df["units"].values:
-            base_time = results_df[results_df["units"] == 1]["time"].iloc[0]
+        # Ideal scaling of the C checkers; the Python single-worker time would skew it
+        c_single = results_df[(results_df["units"] == 1) & (results_df["type"] != "Python")]
+        if not c_single.empty:
+            base_time = c_single["time"].iloc[0]
             x_range = np.linspace(1, max_units, 100)
             ideal_times = [base_time/x for x in x_range]
             plt.plot(x_range, ideal_times, linestyle='--', color='gray', alpha=0.7, label='Ideal')
@@ -2,13 +2,14 @@ import pandas as pd
 import matplotlib.pyplot as plt
 import argparse
 import sys
-import os
 import numpy as np
 
+from results_io import add_source_arguments, load_source
+
 def main():
     # Set up command-line argument parsing
     parser = argparse.ArgumentParser(description="Plot speedup and efficiency graphs from results file")
-    parser.add_argument("results_file", help="Path to the results CSV file")
+    add_source_arguments(parser)
     parser.add_argument("--hybrid", action="store_true", help="Process as hybrid results (format: procs,threads,size,time)")
     parser.add_argument("--units", "-u", type=int, nargs="+", default=[1, 2, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16],
                         help="Parallel unit numbers to include in the analysis (default: 1-16)")
@@ -34,7 +35,7 @@ def main():
     efficiency_title = args.title_efficiency
     is_hybrid = args.hybrid
 
-    print(f"Using results file: {results_file}")
+    print(f"Using results file: {results_file or args.db}")
     if is_hybrid:
         print("Processing as hybrid results (procs,threads,size,time)")
     else:
@@ -44,13 +45,9 @@ def main():
 
     try:
         # Load data from results CSV with appropriate column names
+        df, output_dir = load_source(args, hybrid=is_hybrid)
         if is_hybrid:
-            df = pd.read_csv(results_file, names=["procs", "threads", "size", "time"])
-            # Calculate total units (processes × threads)
-            df["units"] = df["procs"] * df["threads"]
             print("Calculated total units from processes and threads per process")
-        else:
-            df = pd.read_csv(results_file, names=["units", "size", "time"])
 
         # Filter units if needed
         if not is_hybrid:  # For hybrid data, we'll keep all combinations
@@ -67,6 +64,10 @@ def main():
             df["threads"] = df["threads"].astype(int)
         df["units"] = df["units"].astype(int)
 
+        # Repeated runs of the same configuration are averaged
+        group_keys = ["procs", "threads", "units", "size"] if is_hybrid else ["units", "size"]
+        df = df.groupby(group_keys, as_index=False)["time"].mean()
+
         # Calculate speedup and efficiency
         speedup_data = []
         efficiency_data = []
@@ -149,11 +150,6 @@ def main():
             print("No data points to plot. Check if your units filter matches data in the file.")
             return 1
 
-        # Output directory extraction from results file path
-        output_dir = os.path.dirname(results_file)
-        if not output_dir:
-            output_dir = "."
-
         # --- SPEEDUP CHART ---
         plt.figure(figsize=(12, 7))
 
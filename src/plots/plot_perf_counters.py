@@ -0,0 +1,102 @@
+import matplotlib.pyplot as plt
+import argparse
+import os
+import sys
+
+from results_io import read_perf, size_label
+
+def main():
+    # Set up command-line argument parsing
+    parser = argparse.ArgumentParser(description="Plot IPC and miss rates vs parallel units from perf counter results")
+    parser.add_argument("perf_file", help="Path to the perf counters CSV file (out/perf.*.csv)")
+    parser.add_argument("--hybrid", action="store_true",
+                        help="Process as hybrid results (format: procs,threads,size,time,rank,counters...)")
+    parser.add_argument("--prefix", help="Prefix for output filenames", default="")
+    parser.add_argument("--suffix", help="Suffix for output filenames", default="")
+    parser.add_argument("--label", help="Label for the x-axis (e.g., 'Threads', 'Processes', 'Total Units')",
+                        default="Parallel units")
+    parser.add_argument("--title", help="Title prefix for the plots", default="Hardware counters")
+
+    # Parse arguments
+    args = parser.parse_args()
+    perf_file = args.perf_file
+    prefix = args.prefix
+    suffix = args.suffix
+    x_label = args.label
+    is_hybrid = args.hybrid
+
+    print(f"Using perf counters file: {perf_file}")
+    print(f"Output prefix: '{prefix}', suffix: '{suffix}'")
+
+    try:
+        df = read_perf(perf_file, hybrid=is_hybrid)
+        df = df.dropna(subset=["cycles", "instructions"])
+        if df.empty:
+            print("No counter data to plot. Check that perf can read cycles and instructions.")
+            return 1
+
+        min_size = df["size"].min()
+
+        # Output directory extraction from perf file path
+        output_dir = os.path.dirname(perf_file)
+        if not output_dir:
+            output_dir = "."
+
+        # Keep the aggregated counters next to each result row
+        merged_file = f"{output_dir}/{prefix}perf_summary{suffix}.csv"
+        df.to_csv(merged_file, index=False)
+
+        def plot_by_size(ax, column):
+            for size in sorted(df["size"].unique()):
+                # Hybrid layouts with the same total units are averaged
+                subset = df[df["size"] == size].groupby("units")[column].mean()
+                ax.plot(subset.index, subset.values, marker='o', label=size_label(size, min_size))
+            ax.set_xlabel(x_label)
+            ax.grid(True)
+
+        # --- IPC CHART ---
+        fig, ax = plt.subplots(figsize=(12, 7))
+        plot_by_size(ax, "ipc")
+        ax.set_ylabel("Instructions per cycle")
+        ax.set_title(f"{args.title}: IPC")
+        ax.legend(title="Problem size", loc='upper left', bbox_to_anchor=(1, 1))
+        ipc_file = f"{output_dir}/{prefix}ipc_vs_units{suffix}.png"
+        fig.tight_layout()
+        fig.savefig(ipc_file)
+
+        # --- MISSES CHART ---
+        fig, (cache_ax, branch_ax) = plt.subplots(1, 2, figsize=(14, 6))
+        plot_by_size(cache_ax, "cache_mpki")
+        cache_ax.set_ylabel("Cache misses per 1000 instructions")
+        cache_ax.set_title(f"{args.title}: cache misses")
+        plot_by_size(branch_ax, "branch_mpki")
+        branch_ax.set_ylabel("Branch misses per 1000 instructions")
+        branch_ax.set_title(f"{args.title}: branch misses")
+        branch_ax.legend(title="Problem size", loc='upper left', bbox_to_anchor=(1, 1))
+        misses_file = f"{output_dir}/{prefix}misses_vs_units{suffix}.png"
+        fig.tight_layout()
+        fig.savefig(misses_file)
+
+        print(f"Plots saved to {ipc_file} and {misses_file}")
+        print(f"Aggregated counters saved to {merged_file}")
+
+        print("\n=== COUNTER SUMMARY ===")
+        print(f"{'Size':<6} {'Units':<6} {'Time (s)':<10} {'IPC':<6} {'Cache MPKI':<11} {'Branch MPKI':<11}")
+        print("-" * 55)
+        for _, row in df.sort_values(["size", "units"]).iterrows():
+            print(f"{size_label(row['size'], min_size):<6} {row['units']:<6} {row['time']:<10.6f} "
+                  f"{row['ipc']:<6.2f} {row['cache_mpki']:<11.3f} {row['branch_mpki']:<11.3f}")
+
+    except FileNotFoundError:
+        print(f"Error: Could not find perf counters file '{perf_file}'")
+        return 1
+    except Exception as e:
+        print(f"Error: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
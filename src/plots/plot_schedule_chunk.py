@@ -0,0 +1,110 @@
+import matplotlib.pyplot as plt
+import argparse
+import sys
+import numpy as np
+
+from results_io import add_source_arguments, load_source, size_label
+
+def main():
+    # Set up command-line argument parsing
+    parser = argparse.ArgumentParser(description="Plot execution time vs OpenMP chunk size for each schedule and thread count")
+    add_source_arguments(parser)
+    parser.add_argument("--hybrid", action="store_true",
+                        help="Process as hybrid results (format: procs,threads,size,time,schedule,chunk)")
+    parser.add_argument("--size", type=int, help="Problem size to analyze (default: largest size in the file)")
+    parser.add_argument("--prefix", help="Prefix for output filename", default="")
+    parser.add_argument("--suffix", help="Suffix for output filename", default="")
+    parser.add_argument("--title", help="Plot title", default="Execution time vs chunk size")
+
+    # Parse arguments
+    args = parser.parse_args()
+    results_file = args.results_file
+    prefix = args.prefix
+    suffix = args.suffix
+    is_hybrid = args.hybrid
+
+    print(f"Using results file: {results_file or args.db}")
+    print(f"Output prefix: '{prefix}', suffix: '{suffix}'")
+
+    try:
+        df, output_dir = load_source(args, hybrid=is_hybrid, suite="schedule")
+        df = df.dropna(subset=["units", "size", "time", "schedule", "chunk"])
+        if df.empty:
+            print("No rows with schedule information. Run the schedule sweep first.")
+            return 1
+
+        df["size"] = df["size"].astype(int)
+        df["units"] = df["units"].astype(int)
+        df["chunk"] = df["chunk"].astype(int)
+
+        min_size = df["size"].min()
+        target_size = args.size if args.size is not None else df["size"].max()
+        df = df[df["size"] == target_size]
+        if df.empty:
+            print(f"No data for size {target_size}")
+            return 1
+
+        print(f"Analyzing workload size: {target_size} ({size_label(target_size, min_size)})")
+
+        # One line per thread count (or process×thread layout for hybrid runs)
+        if is_hybrid:
+            df["config"] = df["procs"].astype(int).astype(str) + "p×" + df["threads"].astype(int).astype(str) + "t"
+        else:
+            df["config"] = df["units"].astype(str) + " threads"
+
+        # Repeated runs of the same configuration are averaged
+        group_keys = ["config", "units", "schedule", "chunk"]
+        avg_df = df.groupby(group_keys, as_index=False)["time"].mean()
+
+        schedules = sorted(avg_df["schedule"].unique())
+        configs = avg_df.sort_values("units")["config"].unique()
+        colors = plt.cm.tab10(np.linspace(0, 1, max(len(configs), 1)))
+        color_map = dict(zip(configs, colors))
+
+        # --- EXECUTION TIME vs CHUNK SIZE, ONE PANEL PER SCHEDULE ---
+        fig, axes = plt.subplots(1, len(schedules), figsize=(6 * len(schedules), 6), sharey=True, squeeze=False)
+
+        for ax, schedule in zip(axes[0], schedules):
+            schedule_df = avg_df[avg_df["schedule"] == schedule]
+            for config in configs:
+                subset = schedule_df[schedule_df["config"] == config].sort_values("chunk")
+                if subset.empty:
+                    continue
+                ax.plot(subset["chunk"], subset["time"], marker='o', color=color_map[config], label=config)
+
+            ax.set_xscale("log", base=2)
+            ax.set_xlabel("Chunk size")
+            ax.set_title(schedule)
+            ax.grid(True)
+
+        axes[0][0].set_ylabel("Execution time [s]")
+        axes[0][-1].legend(title="Configuration", loc='upper left', bbox_to_anchor=(1, 1))
+        fig.suptitle(f"{args.title} ({size_label(target_size, min_size)})")
+
+        output_file = f"{output_dir}/{prefix}time_vs_chunk{suffix}.png"
+        fig.tight_layout()
+        fig.savefig(output_file)
+
+        print(f"Plot saved to {output_file}")
+
+        print(f"\n=== CHEAPEST SCHEDULE per configuration ({size_label(target_size, min_size)}) ===")
+        print(f"{'Config':<14} {'Schedule':<10} {'Chunk':<8} {'Time (s)':<10}")
+        print("-" * 46)
+
+        best = avg_df.loc[avg_df.groupby("config")["time"].idxmin()].sort_values("units")
+        for _, row in best.iterrows():
+            print(f"{row['config']:<14} {row['schedule']:<10} {row['chunk']:<8} {row['time']:<10.6f}")
+
+    except FileNotFoundError:
+        print(f"Error: Could not find results file '{results_file}'")
+        return 1
+    except Exception as e:
+        print(f"Error: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
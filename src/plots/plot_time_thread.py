@@ -1,14 +1,15 @@
 import pandas as pd
 import matplotlib.pyplot as plt
 import argparse
-import os
 import sys
 import numpy as np
 
+from results_io import add_source_arguments, load_source
+
 def main():
     # Set up command-line argument parsing
     parser = argparse.ArgumentParser(description="Plot execution time vs parallel units (threads/processes) from results file")
-    parser.add_argument("results_file", help="Path to the results CSV file")
+    add_source_arguments(parser)
     parser.add_argument("--hybrid", action="store_true", help="Process as hybrid results (format: procs,threads,size,time)")
     parser.add_argument("--prefix", help="Prefix for output filename", default="")
     parser.add_argument("--suffix", help="Suffix for output filename", default="")
@@ -28,7 +29,7 @@ def main():
     is_hybrid = args.hybrid
     by_config = args.by_config
 
-    print(f"Using results file: {results_file}")
+    print(f"Using results file: {results_file or args.db}")
     if is_hybrid:
         print("Processing as hybrid results (procs,threads,size,time)")
     else:
@@ -37,13 +38,9 @@ def main():
 
     try:
         # Load data
+        df, output_dir = load_source(args, hybrid=is_hybrid)
         if is_hybrid:
-            df = pd.read_csv(results_file, names=["procs", "threads", "size", "time"])
-            # Calculate total units (processes × threads)
-            df["units"] = df["procs"] * df["threads"]
             print("Calculated total units from processes and threads per process")
-        else:
-            df = pd.read_csv(results_file, names=["units", "size", "time"])
 
         # Data type conversion and cleaning
         df["size"] = pd.to_numeric(df["size"], errors="coerce")
@@ -52,7 +49,7 @@ def main():
             df["procs"] = pd.to_numeric(df["procs"], errors="coerce")
             df["threads"] = pd.to_numeric(df["threads"], errors="coerce")
         df["units"] = pd.to_numeric(df["units"], errors="coerce")
-        df = df.dropna()
+        df = df.dropna(subset=["units", "size", "time"])
 
         # Calculate minimum size for better labeling
         min_size = df["size"].min()
@@ -61,11 +58,6 @@ def main():
             factor = int(round(size / min_size))
             return f"{factor}W" if factor > 1 else "W"
 
-        # Output directory extraction from results file path
-        output_dir = os.path.dirname(results_file)
-        if not output_dir:
-            output_dir = "."
-
         # --- EXECUTION TIME vs PARALLEL UNITS CHART ---
         plt.figure(figsize=(12, 7))
 
@@ -0,0 +1,152 @@
+import pandas as pd
+import matplotlib.pyplot as plt
+import argparse
+import os
+import sys
+import numpy as np
+
+from results_io import read_results, size_label
+
+BACKENDS = [
+    ("OpenMP", "results.opm.csv", False),
+    ("MPI", "results.mpi.csv", False),
+    ("Hybrid", "results.hybrid.csv", True),
+]
+
+def load_variant_times(variant_dir, results_name, is_hybrid, target_size):
+    """Mean time per configuration of one backend for one build variant."""
+    results_file = os.path.join(variant_dir, results_name)
+    if not os.path.exists(results_file):
+        return None
+
+    df = read_results(results_file, hybrid=is_hybrid)
+    df = df[df["size"] == target_size].copy()
+    if is_hybrid:
+        df["config"] = df["procs"].astype(int).astype(str) + "p×" + df["threads"].astype(int).astype(str) + "t"
+    else:
+        df["config"] = df["units"].astype(int).astype(str)
+    return df.groupby(["config", "units"], as_index=False)["time"].mean()
+
+def main():
+    # Set up command-line argument parsing
+    parser = argparse.ArgumentParser(description="Plot the speedup of each build variant over the baseline build")
+    parser.add_argument("--variants-dir", help="Directory written by variants.sh", default="out/variants")
+    parser.add_argument("--baseline", help="Baseline variant tag (default: first variant in summary.csv)")
+    parser.add_argument("--size", type=int, help="Problem size to compare (default: largest size)")
+    parser.add_argument("--include-invalid", action="store_true",
+                        help="Also plot variants whose match counts failed validation")
+
+    # Parse arguments
+    args = parser.parse_args()
+    variants_dir = args.variants_dir
+
+    print(f"Using variants directory: {variants_dir}")
+
+    try:
+        summary = pd.read_csv(os.path.join(variants_dir, "summary.csv"),
+                              names=["tag", "compiler", "flags", "status"])
+
+        for _, row in summary[summary["status"] != "ok"].iterrows():
+            print(f"Warning: variant {row['tag']} ({row['flags']}) is {row['status']}")
+
+        usable = summary[summary["status"].isin(["ok", "mismatch"] if args.include_invalid else ["ok"])]
+        if usable.empty:
+            print("No usable variants to compare.")
+            return 1
+
+        baseline = args.baseline if args.baseline else summary["tag"].iloc[0]
+        if baseline not in usable["tag"].values:
+            print(f"Error: baseline variant '{baseline}' has no valid results")
+            return 1
+
+        baseline_dir = os.path.join(variants_dir, baseline)
+        sizes = read_results(os.path.join(baseline_dir, "results.opm.csv"))["size"]
+        min_size = sizes.min()
+        target_size = args.size if args.size is not None else sizes.max()
+
+        print(f"Baseline variant: {baseline}")
+        print(f"Analyzing workload size: {target_size} ({size_label(target_size, min_size)})")
+
+        speedup_data = []
+        for backend, results_name, is_hybrid in BACKENDS:
+            base_times = load_variant_times(baseline_dir, results_name, is_hybrid, target_size)
+            if base_times is None or base_times.empty:
+                continue
+
+            for _, variant in usable.iterrows():
+                times = load_variant_times(os.path.join(variants_dir, variant["tag"]), results_name, is_hybrid, target_size)
+                if times is None:
+                    continue
+
+                merged = times.merge(base_times, on=["config", "units"], suffixes=("", "_base"))
+                for _, row in merged.iterrows():
+                    speedup_data.append({
+                        "backend": backend,
+                        "variant": variant["tag"],
+                        "status": variant["status"],
+                        "config": row["config"],
+                        "units": row["units"],
+                        "time": row["time"],
+                        "speedup": row["time_base"] / row["time"]
+                    })
+
+        speedup_df = pd.DataFrame(speedup_data)
+        if speedup_df.empty:
+            print("No matching configurations between the variants and the baseline.")
+            return 1
+
+        # --- VARIANT SPEEDUP CHART, ONE PANEL PER BACKEND ---
+        backends = [backend for backend, _, _ in BACKENDS if backend in speedup_df["backend"].values]
+        variants = list(usable["tag"])
+        colors = plt.cm.tab10(np.linspace(0, 1, max(len(variants), 1)))
+        color_map = dict(zip(variants, colors))
+
+        fig, axes = plt.subplots(1, len(backends), figsize=(7 * len(backends), 6), sharey=True, squeeze=False)
+        bar_width = 0.8 / len(variants)
+
+        for ax, backend in zip(axes[0], backends):
+            backend_df = speedup_df[speedup_df["backend"] == backend]
+            configs = backend_df.sort_values("units")["config"].unique()
+            positions = np.arange(len(configs))
+
+            for i, variant in enumerate(variants):
+                subset = backend_df[backend_df["variant"] == variant].set_index("config").reindex(configs)
+                ax.bar(positions + i * bar_width, subset["speedup"], width=bar_width,
+                       color=color_map[variant], label=variant,
+                       hatch="//" if variant in summary[summary["status"] == "mismatch"]["tag"].values else None)
+
+            ax.axhline(y=1.0, linestyle='--', color='gray', alpha=0.7)
+            ax.set_xticks(positions + bar_width * (len(variants) - 1) / 2)
+            ax.set_xticklabels(configs)
+            ax.set_xlabel("Parallel units")
+            ax.set_title(backend)
+            ax.grid(True, axis='y', alpha=0.3)
+
+        axes[0][0].set_ylabel(f"Speedup over {baseline}")
+        axes[0][-1].legend(title="Variant", loc='upper left', bbox_to_anchor=(1, 1))
+        fig.suptitle(f"Build variant speedup ({size_label(target_size, min_size)})")
+
+        output_file = os.path.join(variants_dir, "variant_speedup.png")
+        fig.tight_layout()
+        fig.savefig(output_file)
+        print(f"Plot saved to {output_file}")
+
+        print(f"\n=== VARIANT SPEEDUP over {baseline} ===")
+        print(f"{'Backend':<8} {'Variant':<34} {'Units':<8} {'Time (s)':<10} {'Speedup':<8}")
+        print("-" * 72)
+        for _, row in speedup_df.sort_values(["backend", "units", "variant"]).iterrows():
+            print(f"{row['backend']:<8} {row['variant']:<34} {row['config']:<8} {row['time']:<10.6f} {row['speedup']:<8.2f}")
+
+    except FileNotFoundError as e:
+        print(f"Error: Could not find file {e.filename}")
+        return 1
+    except Exception as e:
+        print(f"Error: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,313 @@
+"""SQLite store for checker results.
+
+The checkers keep appending to out/results.*.csv; this module ingests those
+files together with run metadata (campaign, host, git revision, build variant)
+so benchmark history survives `make benchmark` and can be queried later.
+
+Usage (from src/):
+    python3 plots/results_db.py ingest out/results.opm.csv out/results.mpi.csv --campaign nightly
+    python3 plots/results_db.py campaigns
+    python3 plots/results_db.py runs --campaign nightly
+
+Ingest only needs the standard library, so it runs outside the plotting venv.
+"""
+import argparse
+import csv
+import datetime
+import hashlib
+import os
+import socket
+import sqlite3
+import subprocess
+import sys
+
+DEFAULT_DB = "out/results.db"
+
+# Default campaign names, same stamp as CAMPAIGN in the Makefiles
+CAMPAIGN_FORMAT = "%Y%m%d-%H%M%S"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id INTEGER PRIMARY KEY,
+    campaign TEXT NOT NULL,
+    backend TEXT NOT NULL,
+    suite TEXT NOT NULL,
+    variant TEXT,
+    host TEXT,
+    git_revision TEXT,
+    recorded_at TEXT NOT NULL,
+    ingested_at TEXT NOT NULL,
+    source_file TEXT NOT NULL,
+    source_rows INTEGER NOT NULL,
+    source_sha1 TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS results (
+    run_id INTEGER NOT NULL REFERENCES runs (run_id),
+    backend TEXT NOT NULL,
+    procs INTEGER,
+    threads INTEGER,
+    units INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    time REAL NOT NULL,
+    schedule TEXT,
+    chunk INTEGER
+);
+CREATE INDEX IF NOT EXISTS results_lookup ON results (backend, size, units);
+CREATE INDEX IF NOT EXISTS results_run ON results (run_id);
+CREATE INDEX IF NOT EXISTS runs_campaign ON runs (campaign, backend, suite);
+CREATE INDEX IF NOT EXISTS runs_source ON runs (source_file);
+"""
+
+# results.<tag>[.<suffix>].csv -> backend name
+BACKEND_TAGS = {"opm": "openmp", "omp": "openmp", "openmp": "openmp", "mpi": "mpi", "hybrid": "hybrid",
+                "python": "python"}
+
+RESULT_COLUMNS = ["procs", "threads", "units", "size", "time", "schedule", "chunk"]
+RUN_COLUMNS = ["run_id", "campaign", "backend", "suite", "variant", "host", "git_revision", "recorded_at"]
+
+
+def connect(db_path=DEFAULT_DB):
+    """Open (and create if needed) the results database."""
+    directory = os.path.dirname(db_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    conn = sqlite3.connect(db_path)
+    # WAL lets plots read while a benchmark is ingesting
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def backend_from_path(path):
+    name = os.path.basename(path).split(".")
+    if len(name) >= 3 and name[0] == "results" and name[1] in BACKEND_TAGS:
+        return BACKEND_TAGS[name[1]]
+    return None
+
+
+def suite_from_path(path):
+    """results.opm.csv is the main benchmark, results.opm.schedule.csv the schedule sweep, etc."""
+    name = os.path.basename(path).split(".")
+    return ".".join(name[2:-1]) if len(name) > 3 else "benchmark"
+
+
+def variant_from_path(path):
+    """Build variant tag for files under out/variants/<tag>/ (see variants.sh)."""
+    parent = os.path.dirname(os.path.abspath(path))
+    if os.path.basename(os.path.dirname(parent)) == "variants":
+        return os.path.basename(parent)
+    return None
+
+
+def git_revision():
+    try:
+        revision = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                                  text=True, check=True).stdout.strip()
+        dirty = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], capture_output=True,
+                               text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return f"{revision}-dirty" if dirty else revision
+
+
+def parse_row(fields, backend):
+    """Map one CSV row onto the results columns, or None for malformed rows."""
+    try:
+        if backend == "hybrid":
+            procs, threads, size, time = int(fields[0]), int(fields[1]), int(fields[2]), float(fields[3])
+            extra = fields[4:6]
+            units = procs * threads
+        else:
+            procs, threads = None, None
+            units, size, time = int(fields[0]), int(fields[1]), float(fields[2])
+            extra = fields[3:5]
+        schedule = extra[0] if len(extra) > 0 and extra[0] else None
+        chunk = int(extra[1]) if len(extra) > 1 and extra[1] else None
+    except (ValueError, IndexError):
+        return None
+    return {"procs": procs, "threads": threads, "units": units, "size": size,
+            "time": time, "schedule": schedule, "chunk": chunk}
+
+
+def ingest_csv(conn, path, backend=None, campaign=None, variant=None, suite=None):
+    """Store the rows of one results CSV as a new run.
+
+    Rows that were already ingested from the same file are skipped, so the
+    append-only CSVs can be ingested repeatedly. Returns the new run id, or
+    None when there was nothing new.
+    """
+    backend = backend or backend_from_path(path)
+    if backend is None:
+        raise ValueError(f"Cannot tell the backend of '{path}', pass --backend")
+
+    with open(path, newline="") as results_file:
+        lines = [line for line in results_file.read().splitlines() if line.strip()]
+
+    source_file = os.path.abspath(path)
+    skip = 0
+    for rows, sha1 in conn.execute("SELECT source_rows, source_sha1 FROM runs WHERE source_file = ? "
+                                   "ORDER BY source_rows DESC", (source_file,)):
+        if rows <= len(lines) and hashlib.sha1("\n".join(lines[:rows]).encode()).hexdigest() == sha1:
+            skip = rows
+            break
+
+    rows = [parse_row(fields, backend) for fields in csv.reader(lines[skip:])]
+    rows = [row for row in rows if row is not None]
+    if not rows:
+        return None
+
+    variant = variant or variant_from_path(path)
+    suite = suite or ("variants" if variant else suite_from_path(path))
+    recorded_at = datetime.datetime.fromtimestamp(os.path.getmtime(path)).isoformat(timespec="seconds")
+    with conn:
+        cursor = conn.execute(
+            "INSERT INTO runs (campaign, backend, suite, variant, host, git_revision, recorded_at, ingested_at, "
+            "source_file, source_rows, source_sha1) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (campaign or datetime.datetime.fromtimestamp(os.path.getmtime(path)).strftime(CAMPAIGN_FORMAT), backend, suite, variant, socket.gethostname(),
+             git_revision(), recorded_at, datetime.datetime.now().isoformat(timespec="seconds"),
+             source_file, len(lines), hashlib.sha1("\n".join(lines).encode()).hexdigest()))
+        run_id = cursor.lastrowid
+        conn.executemany(
+            "INSERT INTO results (run_id, backend, procs, threads, units, size, time, schedule, chunk) "
+            "VALUES (:run_id, :backend, :procs, :threads, :units, :size, :time, :schedule, :chunk)",
+            [dict(row, run_id=run_id, backend=backend) for row in rows])
+    return run_id
+
+
+def query_results(conn, backend=None, campaign=None, run_id=None, suite=None, variant=None, size=None,
+                  units=None, schedule=None, after_row=None):
+    """Select result rows joined with their run metadata.
+
+    Every filter is optional; campaign and run_id also accept lists, and
+    after_row only returns rows stored after that row_id (for tailing).
+    Returns a list of dicts with row_id + RUN_COLUMNS + RESULT_COLUMNS keys.
+    """
+    conditions, params = [], []
+
+    def match(column, value):
+        if value is None:
+            return
+        if isinstance(value, (list, tuple, set)):
+            conditions.append(f"{column} IN ({', '.join('?' * len(value))})")
+            params.extend(value)
+        else:
+            conditions.append(f"{column} = ?")
+            params.append(value)
+
+    match("r.backend", backend)
+    match("runs.campaign", campaign)
+    match("r.run_id", run_id)
+    match("runs.suite", suite)
+    match("runs.variant", variant)
+    match("r.size", size)
+    match("r.units", units)
+    match("r.schedule", schedule)
+    if after_row is not None:
+        conditions.append("r.rowid > ?")
+        params.append(after_row)
+
+    columns = ["r.rowid"] + [f"runs.{column}" for column in RUN_COLUMNS if column != "backend"] + ["r.backend"]
+    columns += [f"r.{column}" for column in RESULT_COLUMNS]
+    sql = f"SELECT {', '.join(columns)} FROM results r JOIN runs ON runs.run_id = r.run_id"
+    if conditions:
+        sql += " WHERE " + " AND ".join(conditions)
+    sql += " ORDER BY r.run_id, r.rowid"
+
+    names = ["row_id"] + [column.split(".")[1] for column in columns[1:]]
+    return [dict(zip(names, row)) for row in conn.execute(sql, params)]
+
+
+def load_results(db_path=DEFAULT_DB, **filters):
+    """query_results() as a DataFrame with the same columns as results_io.read_results()."""
+    import pandas as pd
+
+    conn = connect(db_path)
+    try:
+        rows = query_results(conn, **filters)
+    finally:
+        conn.close()
+    return pd.DataFrame(rows, columns=RUN_COLUMNS + RESULT_COLUMNS)
+
+
+def list_campaigns(conn, backend=None, suite=None):
+    """(campaign, backend, suite, runs, rows, first recorded, last recorded) tuples, newest first."""
+    sql = ("SELECT runs.campaign, runs.backend, runs.suite, COUNT(DISTINCT runs.run_id), COUNT(r.rowid), "
+           "MIN(runs.recorded_at), MAX(runs.recorded_at) FROM runs JOIN results r ON r.run_id = runs.run_id")
+    conditions, params = [], []
+    if backend:
+        conditions.append("runs.backend = ?")
+        params.append(backend)
+    if suite:
+        conditions.append("runs.suite = ?")
+        params.append(suite)
+    if conditions:
+        sql += " WHERE " + " AND ".join(conditions)
+    sql += " GROUP BY runs.campaign, runs.backend, runs.suite ORDER BY MAX(runs.recorded_at) DESC"
+    return conn.execute(sql, params).fetchall()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Store and query checker results in a SQLite database")
+    parser.add_argument("--db", help=f"Path to the results database (default: {DEFAULT_DB})", default=DEFAULT_DB)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    ingest = commands.add_parser("ingest", help="Ingest results CSV files")
+    ingest.add_argument("results_files", nargs="+", help="Results CSV files; missing files are skipped")
+    ingest.add_argument("--campaign", help="Campaign name (default: time of this ingest)")
+    ingest.add_argument("--backend", choices=sorted(set(BACKEND_TAGS.values())),
+                        help="Backend (default: from the file name)")
+    ingest.add_argument("--suite", help="Suite name (default: from the file name, e.g. schedule for results.opm.schedule.csv)")
+    ingest.add_argument("--variant", help="Build variant tag (default: from out/variants/<tag>/ paths)")
+
+    campaigns = commands.add_parser("campaigns", help="List campaigns")
+    campaigns.add_argument("--backend", help="Only list campaigns of this backend")
+
+    runs = commands.add_parser("runs", help="List result rows")
+    runs.add_argument("--campaign", help="Only rows of this campaign")
+    runs.add_argument("--backend", help="Only rows of this backend")
+    runs.add_argument("--suite", help="Only rows of this suite")
+    runs.add_argument("--size", type=int, help="Only rows of this problem size")
+
+    args = parser.parse_args()
+    conn = connect(args.db)
+
+    try:
+        if args.command == "ingest":
+            campaign = args.campaign or datetime.datetime.now().strftime(CAMPAIGN_FORMAT)
+            for path in args.results_files:
+                if not os.path.exists(path):
+                    print(f"Skipping {path}: not found")
+                    continue
+                run_id = ingest_csv(conn, path, backend=args.backend, campaign=campaign, variant=args.variant,
+                                    suite=args.suite)
+                if run_id is None:
+                    print(f"{path}: nothing new to ingest")
+                else:
+                    count = conn.execute("SELECT COUNT(*) FROM results WHERE run_id = ?", (run_id,)).fetchone()[0]
+                    print(f"{path}: ingested {count} rows as run {run_id}")
+
+        elif args.command == "campaigns":
+            print(f"{'Campaign':<24} {'Backend':<8} {'Suite':<10} {'Runs':<5} {'Rows':<6} {'First':<20} {'Last':<20}")
+            print("-" * 99)
+            for campaign, backend, suite, run_count, row_count, first, last in list_campaigns(conn, args.backend):
+                print(f"{campaign:<24} {backend:<8} {suite:<10} {run_count:<5} {row_count:<6} {first:<20} {last:<20}")
+
+        elif args.command == "runs":
+            rows = query_results(conn, backend=args.backend, campaign=args.campaign, suite=args.suite, size=args.size)
+            print(f"{'Run':<5} {'Campaign':<24} {'Backend':<8} {'Units':<6} {'Size':<9} {'Time (s)':<10}")
+            print("-" * 66)
+            for row in rows:
+                print(f"{row['run_id']:<5} {row['campaign']:<24} {row['backend']:<8} "
+                      f"{row['units']:<6} {row['size']:<9} {row['time']:<10.6f}")
+
+    except ValueError as e:
+        print(f"Error: {e}")
+        return 1
+    finally:
+        conn.close()
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
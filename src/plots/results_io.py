@@ -0,0 +1,101 @@
+import os
+
+import pandas as pd
+
+# Column layouts written by the checkers. Older result files lack the trailing
+# schedule columns; pandas fills them with NaN when reading.
+STANDARD_COLUMNS = ["units", "size", "time", "schedule", "chunk"]
+HYBRID_COLUMNS = ["procs", "threads", "size", "time", "schedule", "chunk"]
+
+# Rows written by perf/benchmark_perf.sh, one per MPI rank
+COUNTER_COLUMNS = ["cycles", "instructions", "cache_misses", "branch_misses"]
+STANDARD_PERF_COLUMNS = ["units", "size", "time", "rank"] + COUNTER_COLUMNS
+HYBRID_PERF_COLUMNS = ["procs", "threads", "size", "time", "rank"] + COUNTER_COLUMNS
+
+
+def read_results(results_file, hybrid=False):
+    """Load a checker results CSV, adding a units column for hybrid runs."""
+    if hybrid:
+        df = pd.read_csv(results_file, names=HYBRID_COLUMNS)
+        # Calculate total units (processes × threads)
+        df["units"] = df["procs"] * df["threads"]
+    else:
+        df = pd.read_csv(results_file, names=STANDARD_COLUMNS)
+    return df
+
+
+def add_source_arguments(parser):
+    """Results can come from a CSV file or from the results database."""
+    parser.add_argument("results_file", nargs="?", help="Path to the results CSV file")
+    parser.add_argument("--db", help="Read results from this SQLite database (see results_db.py) instead of a CSV file")
+    parser.add_argument("--campaign", nargs="+", help="With --db: campaigns to include (default: latest campaign)")
+    parser.add_argument("--backend", choices=["openmp", "mpi", "hybrid", "python"],
+                        help="With --db: backend to select (default: hybrid with --hybrid, otherwise required)")
+
+
+def load_source(args, hybrid=False, suite="benchmark"):
+    """Load results selected by add_source_arguments(); returns (df, output_dir)."""
+    if args.db is None:
+        if args.results_file is None:
+            raise ValueError("Pass a results file or --db")
+        output_dir = os.path.dirname(args.results_file) or "."
+        return read_results(args.results_file, hybrid=hybrid), output_dir
+
+    backend = args.backend or ("hybrid" if hybrid else None)
+    if backend is None:
+        raise ValueError("Pass --backend when reading from --db")
+
+    return load_campaigns(args.db, backend, args.campaign, suite), os.path.dirname(args.db) or "."
+
+
+def load_campaigns(db_path, backend, campaigns=None, suite="benchmark"):
+    """Results of one backend and suite from the database, by default of its latest campaign."""
+    from results_db import connect, list_campaigns, load_results
+
+    if not campaigns:
+        conn = connect(db_path)
+        try:
+            latest = list_campaigns(conn, backend, suite)
+        finally:
+            conn.close()
+        if not latest:
+            raise ValueError(f"No {backend} results in {db_path}")
+        campaigns = [latest[0][0]]
+
+    print(f"Reading {backend} results of campaign(s) {', '.join(campaigns)} from {db_path}")
+    return load_results(db_path, backend=backend, campaign=campaigns, suite=suite)
+
+
+def read_perf(perf_file, hybrid=False):
+    """Load per-rank perf counters and sum them for every run.
+
+    Returns one row per (units, size) with the counters summed over ranks,
+    the overall IPC and the lowest per-rank IPC.
+    """
+    if hybrid:
+        df = pd.read_csv(perf_file, names=HYBRID_PERF_COLUMNS)
+        df["units"] = df["procs"] * df["threads"]
+        keys = ["procs", "threads", "units", "size"]
+    else:
+        df = pd.read_csv(perf_file, names=STANDARD_PERF_COLUMNS)
+        keys = ["units", "size"]
+
+    for column in COUNTER_COLUMNS:
+        df[column] = pd.to_numeric(df[column], errors="coerce")
+    df["ipc"] = df["instructions"] / df["cycles"]
+
+    totals = df.groupby(keys, as_index=False).agg(
+        time=("time", "mean"),
+        ranks=("rank", "nunique"),
+        min_rank_ipc=("ipc", "min"),
+        **{column: (column, lambda values: values.sum(min_count=1)) for column in COUNTER_COLUMNS},
+    )
+    totals["ipc"] = totals["instructions"] / totals["cycles"]
+    totals["cache_mpki"] = totals["cache_misses"] / totals["instructions"] * 1000
+    totals["branch_mpki"] = totals["branch_misses"] / totals["instructions"] * 1000
+    return totals
+
+
+def size_label(size, min_size):
+    factor = int(round(size / min_size))
+    return f"{factor}W" if factor > 1 else "W"
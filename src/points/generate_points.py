@@ -5,6 +5,8 @@ import math
 
 list_sizes = [100000, 200000, 400000, 800000, 1600000]
 output_dir = "point_lists"
+# Same tolerance as TOLERANCE in the checkers
+tolerance = 1e-3
 os.makedirs(output_dir, exist_ok=True)
 
 # f(x) = ax^5 + bx^4 + cx^3 + dx^2 + ex + f
@@ -57,15 +59,23 @@ def f(x, coeffs):
 with open(os.path.join(output_dir, "coeffs.json"), "w") as coeff_file:
     json.dump(coeffs, coeff_file)
 
+expected_matches = {}
+
 for i, size in enumerate(list_sizes):
     points = []
+    matches = 0
     for _ in range(size):
         x = random.uniform(-1000, 1000)
+        expected = f(x, coeffs)
         if random.random() < 0.5:  # 50% matches the function
-            y = f(x, coeffs)
+            y = expected
         else:
-            y = f(x, coeffs) + random.uniform(-50, 50)
+            y = expected + random.uniform(-50, 50)
+        # Large |f(x)| swallows most offsets, so count what the checkers should find
+        if abs(expected - y) < tolerance:
+            matches += 1
         points.append((x, y))
+    expected_matches[size] = matches
     
     file_path = os.path.join(output_dir, f"points_{size}.txt")
     with open(file_path, "w") as points_file:
@@ -76,4 +86,7 @@ with open(os.path.join(output_dir, "sizes.txt"), "w") as size_file:
     for size in list_sizes:
         size_file.write(f"{size}\n")
 
-
+# Expected match counts, used to validate build variants
+with open(os.path.join(output_dir, "expected.txt"), "w") as expected_file:
+    for size in list_sizes:
+        expected_file.write(f"{size},{expected_matches[size]}\n")
@@ -1,6 +1,9 @@
 #!/usr/bin/env bash
 set -e
 
+# One campaign for every make call below (each make would otherwise stamp its own)
+export CAMPAIGN=${CAMPAIGN:-$(date +%Y%m%d-%H%M%S)}
+
 if [[ ! -d "point_lists" ]]; then
     python3 points/generate_points.py
 fi
@@ -8,9 +11,11 @@ fi
 if [[ $OSTYPE == "darwin"* ]]; then
     make -f Makefile.mac
     make -f Makefile.mac benchmark
+    make -f Makefile.mac benchmark-schedule
 else
-    echo "Implement Makefile for other distros lol"
-    exit 1
+    make
+    make benchmark
+    make benchmark-schedule
 fi
 
 if [[ ! -d "../.venv" ]]; then
@@ -20,6 +25,13 @@ fi
 
 source ../.venv/bin/activate
 
+# The Python checker needs numpy from the venv
+if [[ $OSTYPE == "darwin"* ]]; then
+    make -f Makefile.mac benchmark-python
+else
+    make benchmark-python
+fi
+
 # OpenMP
 python3 plots/plot_efficiency_and_speedup.py out/results.opm.csv --prefix "openmp_" --label "Number of threads"
 python3 plots/plot_time_thread.py out/results.opm.csv --prefix "openmp_" --label "Number of threads" --title "OpenMP thread scaling"
@@ -31,3 +43,27 @@ python3 plots/plot_time_thread.py out/results.mpi.csv --prefix "mpi_" --label "N
 # Hybrid
 python3 plots/plot_efficiency_and_speedup.py out/results.hybrid.csv --prefix "hybrid_" --label "Number of process x threads" --hybrid
 python3 plots/plot_time_thread.py out/results.hybrid.csv --prefix "hybrid_" --label "Number of process x threads" --title "Hybrid scaling" --hybrid
+
+# Python
+python3 plots/plot_efficiency_and_speedup.py out/results.python.csv --prefix "python_" --label "Number of workers"
+python3 plots/plot_time_thread.py out/results.python.csv --prefix "python_" --label "Number of workers" --title "Python worker scaling"
+
+# OpenMP schedule sweep
+python3 plots/plot_schedule_chunk.py out/results.opm.schedule.csv --prefix "openmp_" --title "OpenMP schedule sweep"
+python3 plots/plot_schedule_chunk.py out/results.hybrid.schedule.csv --prefix "hybrid_" --title "Hybrid schedule sweep" --hybrid
+
+# Build variants (./variants.sh or make variants)
+if [[ -f "out/variants/summary.csv" ]]; then
+    python3 plots/plot_variants.py --variants-dir out/variants
+fi
+
+# Hardware counters (make benchmark-perf, Linux only)
+if [[ -f "out/perf.opm.csv" ]]; then
+    python3 plots/plot_perf_counters.py out/perf.opm.csv --prefix "openmp_" --label "Number of threads" --title "OpenMP"
+fi
+if [[ -f "out/perf.mpi.csv" ]]; then
+    python3 plots/plot_perf_counters.py out/perf.mpi.csv --prefix "mpi_" --label "Number of processes" --title "MPI"
+fi
+if [[ -f "out/perf.hybrid.csv" ]]; then
+    python3 plots/plot_perf_counters.py out/perf.hybrid.csv --prefix "hybrid_" --label "Number of process x threads" --title "Hybrid" --hybrid
+fi
@@ -0,0 +1,138 @@
+#!/usr/bin/env bash
+# Builds all three checkers under a matrix of compilers and flags, runs a short
+# benchmark with every build and validates the match counts against
+# point_lists/expected.txt (written by points/generate_points.py).
+#
+# Usage (from src/): ./variants.sh
+#
+# Output:
+#   out/variants/<tag>/check_points_*            binaries
+#   out/variants/<tag>/results.{opm,mpi,hybrid}.csv
+#   out/variants/<tag>/log.txt                   checker output used for validation
+#   out/variants/summary.csv                     tag,compiler,flags,status
+set -e
+
+MAKEFILE=${MAKEFILE:-Makefile}
+MPIRUN=${MPIRUN:-mpirun}
+VARIANTS_DIR=${VARIANTS_DIR:-out/variants}
+UNITS=${UNITS:-"1 4 8 16"}
+HYBRID_CONFIGS=${HYBRID_CONFIGS:-"1x1 2x2 4x4"}
+
+if [[ $OSTYPE == "darwin"* ]]; then
+    COMPILERS=${COMPILERS:-"clang"}
+else
+    COMPILERS=${COMPILERS:-"gcc clang"}
+fi
+
+# name:flags, the first entry of the first compiler is the baseline build
+FLAG_SETS=(
+    "O2:-O2"
+    "O3:-O3"
+    "O3-native:-O3 -march=native"
+    "O3-native-nocontract:-O3 -march=native -ffp-contract=off"
+    "O3-native-fastmath:-O3 -march=native -ffast-math"
+)
+
+# Prints "cflags|ldflags" for a vector math library, or nothing when the
+# compiler has none. gcc on glibc already calls libmvec under -ffast-math.
+vecmath_flags() {
+    case $1 in
+        clang*)
+            if [[ $OSTYPE == "darwin"* ]]; then
+                echo "-fveclib=Accelerate|-framework Accelerate"
+            else
+                echo "-fveclib=libmvec|-lmvec"
+            fi
+            ;;
+    esac
+}
+
+# Prints "size,matches" pairs reported in a checker log
+match_counts() {
+    sed -n 's/.*points_\([0-9]*\)\.txt | Matches: \([0-9]*\) .*/\1,\2/p' "$1" | sort -u
+}
+
+if [[ ! -f "point_lists/sizes.txt" ]]; then
+    echo "Missing point_lists/sizes.txt, run points/generate_points.py first"
+    exit 1
+fi
+
+rm -rf "$VARIANTS_DIR"
+mkdir -p "$VARIANTS_DIR"
+SUMMARY="$VARIANTS_DIR/summary.csv"
+
+# Without expected.txt the baseline build becomes the reference
+EXPECTED=""
+if [[ -f "point_lists/expected.txt" ]]; then
+    EXPECTED="point_lists/expected.txt"
+fi
+
+run_variant() {
+    local dir=$1
+
+    for t in $UNITS; do
+        echo "  Running OpenMP with $t threads..."
+        RESULTS_FILE="$dir/results.opm.csv" "$dir/check_points_openmp" "$t" >> "$dir/log.txt" || return 1
+    done
+    for p in $UNITS; do
+        echo "  Running MPI with $p processes..."
+        RESULTS_FILE="$dir/results.mpi.csv" $MPIRUN -np "$p" "$dir/check_points_mpi" >> "$dir/log.txt" || return 1
+    done
+    for config in $HYBRID_CONFIGS; do
+        echo "  Running Hybrid with ${config%x*} processes and ${config#*x} threads per process..."
+        RESULTS_FILE="$dir/results.hybrid.csv" $MPIRUN -np "${config%x*}" "$dir/check_points_hybrid" "${config#*x}" >> "$dir/log.txt" || return 1
+    done
+}
+
+for cc in $COMPILERS; do
+    if ! command -v "$cc" > /dev/null; then
+        echo "Skipping $cc: not installed"
+        continue
+    fi
+
+    variants=("${FLAG_SETS[@]}")
+    vecmath=$(vecmath_flags "$cc")
+    if [[ -n $vecmath ]]; then
+        variants+=("O3-native-fastmath-vecmath:-O3 -march=native -ffast-math ${vecmath%|*}")
+    fi
+
+    for variant in "${variants[@]}"; do
+        tag="$cc-${variant%%:*}"
+        flags="${variant#*:}"
+        ldflags=""
+        if [[ $tag == *-vecmath ]]; then
+            ldflags="${vecmath#*|}"
+        fi
+        dir="$VARIANTS_DIR/$tag"
+
+        echo "Building $tag ($flags)..."
+        if ! OMPI_CC=$cc MPICH_CC=$cc make -s -B -f "$MAKEFILE" all CC_OMP="$cc" OPT="$flags" \
+                EXTRA_LDFLAGS="$ldflags" OUT_DIR="$dir" > "$dir.build.log" 2>&1; then
+            echo "  Build failed, see $dir.build.log"
+            echo "$tag,$cc,$flags,build-failed" >> "$SUMMARY"
+            continue
+        fi
+
+        if ! run_variant "$dir"; then
+            echo "  Run failed, see $dir/log.txt"
+            echo "$tag,$cc,$flags,run-failed" >> "$SUMMARY"
+            continue
+        fi
+
+        if [[ -z $EXPECTED ]]; then
+            EXPECTED="$VARIANTS_DIR/expected.txt"
+            match_counts "$dir/log.txt" > "$EXPECTED"
+            echo "  No point_lists/expected.txt, using $tag match counts as reference"
+        fi
+
+        mismatches=$(match_counts "$dir/log.txt" | awk -F, 'NR == FNR { expected[$1] = $2; next } expected[$1] != $2' "$EXPECTED" -)
+        if [[ -n $mismatches ]]; then
+            echo "  Match counts differ from $EXPECTED (size,matches): $(echo $mismatches)"
+            echo "$tag,$cc,$flags,mismatch" >> "$SUMMARY"
+        else
+            echo "$tag,$cc,$flags,ok" >> "$SUMMARY"
+        fi
+    done
+done
+
+echo "Variant builds completed. Summary in $SUMMARY"